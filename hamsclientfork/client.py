@@ -1,14 +1,28 @@
-import geopy
-import geopy.distance
+import codecs
+import hashlib
+import html
 import json
 import logging
+import math
+import os
+import re
 import requests  # type: ignore
 import datetime
 import csv
 
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Any, TypedDict
+from requests.adapters import HTTPAdapter  # type: ignore
+from typing import Any, Iterable, TypedDict, cast
+from urllib3.util import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 
 class StationType(str, Enum):
@@ -23,11 +37,17 @@ _LOGGER = logging.getLogger(__name__)
 _HEADERS = {
     "Accept": "text/html,application/xhtml+xml,application/xml;"
     "q=0.9,image/webp,*/*;q=0.8",
-    "Accept-Encoding": "gzip, deflate, sdch",
+    # Only advertise the encodings urllib3 can decode here (br and zstd
+    # depend on optional modules being installed).
+    "Accept-Encoding": ACCEPT_ENCODING,
     "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML"
     ", like Gecko) Chrome/1337 Safari/537.36",
 }
 
+# (connect, read) timeouts: fail fast on unreachable hosts while giving
+# the servers time to generate the larger CSV and JSON documents.
+_TIMEOUT = (3.05, 10)
+
 MS_BASE_URL = "https://www.meteosuisse.admin.ch"
 JSON_FORECAST_URL = "https://app-prod-ws.meteoswiss-app.ch/v2/forecast?plz={}00&graph_startLowResolution=true&warning=true"
 MS_SEARCH_URL = "https://www.meteosuisse.admin.ch/home/actualite/infos.html?ort={}&pageIndex=0&tab=search_tab"
@@ -46,6 +66,110 @@ MS_24FORECAST_URL = (
 )
 MS_24FORECAST_REF = "https://www.meteosuisse.admin.ch//content/meteoswiss/fr/home.mobile.meteo-products--overview.html"
 
+# The 24h forecast JSON URL is carried by the weather widget section of
+# the search page.
+_WEATHER_WIDGET_RE = re.compile(
+    rb'<section[^>]*?id="weather-widget"[^>]*?data-json-url="([^"]+)"', re.S
+)
+
+# Compass points, each covering a 22.5 degree sector centred on its bearing.
+_BEARINGS = (
+    "N",
+    "NNE",
+    "NE",
+    "ENE",
+    "E",
+    "ESE",
+    "SE",
+    "SSE",
+    "S",
+    "SSW",
+    "SW",
+    "WSW",
+    "W",
+    "WNW",
+    "NW",
+    "NNW",
+)
+
+
+def _read_csv(lines: Iterable[bytes]) -> list[dict[str, str]]:
+    # Decode line by line rather than decoding the whole document as
+    # text and splitting it.
+    csv_reader = csv.DictReader(codecs.iterdecode(lines, "iso_8859_1"), delimiter=";")
+    return [row for row in csv_reader if row]
+
+
+def _validator_headers(etag: str | None, lastModified: str | None) -> dict[str, str]:
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if lastModified:
+        headers["If-Modified-Since"] = lastModified
+    return headers
+
+
+def _log_response_encoding(response: requests.Response) -> None:
+    _LOGGER.debug(
+        "Reading %s (Content-Encoding: %s)",
+        response.url,
+        response.headers.get("Content-Encoding"),
+    )
+
+
+# Bump whenever the station dicts built by __get_all_stations change shape,
+# so caches written by older versions are not reused after an upgrade.
+_STATION_CACHE_VERSION = 1
+
+
+def _station_cache_path() -> str:
+    cacheHome = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cacheHome, "hamsclient", "stations.json")
+
+
+def _read_station_cache() -> dict[str, Any] | None:
+    path = _station_cache_path()
+    try:
+        with open(path, "rb") as f:
+            cache = _loads(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception:
+        _LOGGER.debug("Ignoring unreadable station cache %s", path, exc_info=True)
+        return None
+    if not isinstance(cache, dict) or not isinstance(cache.get("data"), dict):
+        return None
+    if cache.get("version") != _STATION_CACHE_VERSION:
+        _LOGGER.debug("Ignoring station cache %s from another version", path)
+        return None
+    # Rebuild the station dicts up front so a damaged entry turns the whole
+    # cache into a miss (and an unconditional download) rather than an error.
+    try:
+        stations = {}
+        for code, station in cache["data"].items():
+            for key in ("code", "name", "lat", "lon", "altitude"):
+                if not isinstance(station[key], str):
+                    raise TypeError("%s of station %s is not a string" % (key, code))
+            stations[code] = {**station, "type": StationType(station["type"])}
+    except (KeyError, TypeError, ValueError):
+        _LOGGER.debug("Ignoring invalid station cache %s", path, exc_info=True)
+        return None
+    return {**cache, "data": stations}
+
+
+def _write_station_cache(cache: dict[str, Any]) -> None:
+    path = _station_cache_path()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmpPath = "%s.%s.tmp" % (path, os.getpid())
+        with open(tmpPath, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmpPath, path)
+    except OSError:
+        _LOGGER.debug("Unable to write station cache %s", path, exc_info=True)
+
 
 class CurrentWeather(TypedDict):
     time: int
@@ -85,34 +209,32 @@ class HourlyForecast(TypedDict):
 
 
 def HourlyForecast_from_meteoswiss_data(data: dict[str, Any]) -> list[HourlyForecast]:
-    time = datetime.datetime.fromtimestamp(
+    start = datetime.datetime.fromtimestamp(
         data["start"] / 1000, tz=datetime.timezone.utc
     )
-    results: list[HourlyForecast] = []
-    for idx in range(
-        min(
-            [
-                len(data["temperatureMin1h"]),
-                len(data["temperatureMax1h"]),
-                len(data["temperatureMean1h"]),
-                len(data["precipitationMin1h"]),
-                len(data["precipitationMean1h"]),
-                len(data["precipitationMax1h"]),
-            ]
+    hour = datetime.timedelta(hours=1)
+    # zip() stops at the shortest series, like the per-index loop used to.
+    return [
+        HourlyForecast(
+            time=start + idx * hour,
+            temperatureMax=tMax,
+            temperatureMean=tMean,
+            temperatureMin=tMin,
+            precipitationMin=pMin,
+            precipitationMean=pMean,
+            precipitationMax=pMax,
         )
-    ):
-        d = HourlyForecast(
-            time=time,
-            temperatureMax=data["temperatureMax1h"][idx],
-            temperatureMean=data["temperatureMean1h"][idx],
-            temperatureMin=data["temperatureMin1h"][idx],
-            precipitationMin=data["precipitationMin1h"][idx],
-            precipitationMean=data["precipitationMean1h"][idx],
-            precipitationMax=data["precipitationMax1h"][idx],
+        for idx, (tMin, tMax, tMean, pMin, pMean, pMax) in enumerate(
+            zip(
+                data["temperatureMin1h"],
+                data["temperatureMax1h"],
+                data["temperatureMean1h"],
+                data["precipitationMin1h"],
+                data["precipitationMean1h"],
+                data["precipitationMax1h"],
+            )
         )
-        results.append(d)
-        time = time + datetime.timedelta(hours=1)
-    return results
+    ]
 
 
 class Forecast(TypedDict):
@@ -158,36 +280,27 @@ class CurrentCondition(TypedDict):
     tdetows0: float | None
 
 
+# Every CurrentCondition field but the station and date is a float
+# measurement, so derive the list from the TypedDict once at import.
+_CONDITION_FLOAT_FIELDS = tuple(
+    field
+    for field in CurrentCondition.__annotations__
+    if field not in ("station", "date")
+)
+_MISSING_VALUES = frozenset(("", "-", None))
+
+
 def CurrentCondition_from_meteoswiss_data(data: dict[str, Any]) -> CurrentCondition:
-    def floatornone(val: Any) -> float | None:
-        if val == "" or val == "-" or val is None:
-            return None
-        return float(val)
-
-    return CurrentCondition(
-        station=data["Station/Location"],
-        date=int(data["Date"]),
-        tre200s0=floatornone(data.get("tre200s0")),
-        rre150z0=floatornone(data.get("rre150z0")),
-        sre000z0=floatornone(data.get("sre000z0")),
-        gre000z0=floatornone(data.get("gre000z0")),
-        ure200s0=floatornone(data.get("ure200s0")),
-        tde200s0=floatornone(data.get("tde200s0")),
-        dkl010z0=floatornone(data.get("dkl010z0")),
-        fu3010z0=floatornone(data.get("fu3010z0")),
-        fu3010z1=floatornone(data.get("fu3010z1")),
-        prestas0=floatornone(data.get("prestas0")),
-        pp0qffs0=floatornone(data.get("pp0qffs0")),
-        pp0qnhs0=floatornone(data.get("pp0qnhs0")),
-        ppz850s0=floatornone(data.get("ppz850s0")),
-        ppz700s0=floatornone(data.get("ppz700s0")),
-        dv1towz0=floatornone(data.get("dv1towz0")),
-        fu3towz0=floatornone(data.get("fu3towz0")),
-        fu3towz1=floatornone(data.get("fu3towz1")),
-        ta1tows0=floatornone(data.get("ta1tows0")),
-        uretows0=floatornone(data.get("uretows0")),
-        tdetows0=floatornone(data.get("tdetows0")),
-    )
+    get = data.get
+    condition = {
+        "station": data["Station/Location"],
+        "date": int(data["Date"]),
+        **{
+            field: None if (val := get(field)) in _MISSING_VALUES else float(val)
+            for field in _CONDITION_FLOAT_FIELDS
+        },
+    }
+    return cast(CurrentCondition, condition)
 
 
 class ClientResult(TypedDict):
@@ -223,19 +336,46 @@ class meteoSwissClient:
         self._stations = station
         self._name = displayName
         self._allStations: dict[str, Any] | None = None
+        self._stations_by_type: dict[StationType, dict[str, Any]] = {}
+        # Station type (None for all) ->
+        # [(code, latitude, longitude, cos(latitude))], angles in radians
+        self._station_coords: dict[
+            StationType | None, list[tuple[str, float, float, float]]
+        ] = {}
         self._condition = None
         self._conditions: dict[str, Any] = {}
         self._precipitation = None
         self._precipitations: dict[str, Any] = {}
         self._forecast = None
+        # url -> (ETag, Last-Modified, content digest, parsed rows)
+        self._csv_cache: dict[
+            str, tuple[str | None, str | None, bytes, list[dict[str, str]]]
+        ] = {}
+        self._session = requests.Session()
+        # Forcing headers to avoid 500 error when downloading file
+        self._session.headers.update(_HEADERS)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=("GET",),
+                respect_retry_after_header=True,
+                # Hand the last error response back so raise_for_status()
+                # keeps raising HTTPError once the retries are exhausted.
+                raise_on_status=False,
+            ),
+        )
+        self._session.mount("https://", adapter)
         _LOGGER.debug(
             "INIT meteoswiss client : name = %s stations = %s postcode = %s"
             % (self._name, self._stations, self._postCode)
         )
 
     def get_data(self):
-        self.get_forecast()
-        self.get_current_condition()
+        self.update()
         return {
             "name": self._name,
             "forecast": self._forecast,
@@ -249,100 +389,129 @@ class meteoSwissClient:
 
     def get_24hforecast(self):
         _LOGGER.debug("Start update 24h forecast data")
-        s = requests.Session()
-        # Forcing headers to avoid 500 error when downloading file
-        s.headers.update(_HEADERS)
         searchUrl = MS_SEARCH_URL.format(self._postCode)
         _LOGGER.debug("Main URL : %s" % searchUrl)
-        tmpSearch = s.get(searchUrl, timeout=10)
+        tmpSearch = self._session.get(searchUrl, timeout=_TIMEOUT)
+        _log_response_encoding(tmpSearch)
 
-        soup = BeautifulSoup(tmpSearch.text, features="html.parser")
-        widgetHtml = soup.find_all("section", {"id": "weather-widget"})
-        jsonUrl = widgetHtml[0].get("data-json-url")
-        jsonUrl = str(jsonUrl)
+        widget = _WEATHER_WIDGET_RE.search(tmpSearch.content)
+        if widget is None:
+            raise ValueError("No weather widget found at %s" % searchUrl)
+        jsonUrl = html.unescape(widget.group(1).decode("utf-8"))
         version = jsonUrl.split("/")[5]
         forecastUrl = MS_24FORECAST_URL.format(version, self._postCode)
         _LOGGER.debug("Data URL : %s" % forecastUrl)
-        s.headers.update(
-            {
+        jsonData = self._session.get(
+            forecastUrl,
+            headers={
                 "referer": MS_24FORECAST_REF,
                 "x-requested-with": "XMLHttpRequest",
                 "Accept": "application/json, text/javascript, */*; q=0.01",
                 "dnt": "1",
-            }
+            },
+            timeout=_TIMEOUT,
         )
-        jsonData = s.get(forecastUrl, timeout=10)
-        jsonData.encoding = "utf8"
-        jsonDataTxt = jsonData.text
-
-        jsonObj = json.loads(jsonDataTxt)
+        _log_response_encoding(jsonData)
+        jsonObj = _loads(jsonData.content)
 
         self._forecast24 = jsonObj
         _LOGGER.debug("End of 24 forecast udate")
 
     def get_forecast(self):
-        s = requests.Session()
-        # Forcing headers to avoid 500 error when downloading file
-        s.headers.update(_HEADERS)
-
         jsonUrl = JSON_FORECAST_URL.format(self._postCode)
         _LOGGER.debug("Start update forecast data with URL %s", jsonUrl)
-        jsonData = s.get(jsonUrl, timeout=10)
+        jsonData = self._session.get(jsonUrl, timeout=_TIMEOUT)
         jsonData.raise_for_status()
-        jsonObj = jsonData.json()
+        _log_response_encoding(jsonData)
+        jsonObj = _loads(jsonData.content)
 
         self._forecast = jsonObj
         _LOGGER.debug("End of forecast update")
 
+    def _get_csv(self, url: str) -> list[dict[str, str]]:
+        # The condition CSVs are refreshed far less often than they are
+        # polled, so revalidate the last download and skip parsing when
+        # the server answers 304 or sends identical content.
+        cached = self._csv_cache.get(url)
+        headers = _validator_headers(*cached[:2]) if cached else None
+        with self._session.get(url, headers=headers, timeout=_TIMEOUT) as response:
+            if response.status_code == 304 and cached:
+                _LOGGER.debug("%s not modified, reusing parsed rows", url)
+                return cached[3]
+            response.raise_for_status()
+            _log_response_encoding(response)
+            content = response.content
+            etag = response.headers.get("ETag")
+            lastModified = response.headers.get("Last-Modified")
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        if cached and cached[2] == digest:
+            _LOGGER.debug("%s unchanged, reusing parsed rows", url)
+            rows = cached[3]
+        else:
+            rows = _read_csv(content.splitlines())
+        self._csv_cache[url] = (etag, lastModified, digest, rows)
+        return rows
+
     def get_current_condition(self):
         _LOGGER.debug("Update current condition")
-        with requests.get(CURRENT_CONDITION_URL) as response:
-            response.raise_for_status()
-            response.encoding = "iso_8859_1"
-            lines = response.text.split("\n")
-            csv_reader = csv.DictReader(lines, delimiter=";")
-            data = [row for row in csv_reader if row]
-        with requests.get(CURRENT_PRECIPITATION_URL) as response:
-            response.raise_for_status()
-            response.encoding = "iso_8859_1"
-            lines = response.text.split("\n")
-            csv_reader = csv.DictReader(lines, delimiter=";")
-            rain_data = [row for row in csv_reader if row]
+        data = self._get_csv(CURRENT_CONDITION_URL)
+        rain_data = self._get_csv(CURRENT_PRECIPITATION_URL)
+        self._set_current_condition(data, rain_data)
+
+    def _set_current_condition(
+        self, data: list[dict[str, str]], rain_data: list[dict[str, str]]
+    ):
+        byStation = {d["Station/Location"]: d for d in data}
+        rainByStation = {d["Station/Location"]: d for d in rain_data}
         conditions = {}
         condition_list = []
         for station in self._stations:
             _LOGGER.debug("Get current condition for : %s" % station)
-            stationData = [d for d in data if d["Station/Location"] == station]
-            rainData = [d for d in rain_data if d["Station/Location"] == station]
-            if rainData and not stationData:
-                stationData = rainData
-            elif rainData and stationData:
+            stationData = byStation.get(station)
+            rainData = rainByStation.get(station)
+            # Always hand out copies: the parsed rows are kept in _csv_cache
+            # and must not pick up changes made by consumers.
+            if rainData and stationData:
                 # Add all values from the rain data to the station data.
-                for k, v in rainData.items():
-                    stationData[k] = v
-            else:
-                # if
-                # (stationData and not rainData)
-                # or
-                # (not stationData and not rainData)
-                pass
-            condition_list.extend(stationData)
+                stationData = {**stationData, **rainData}
+            elif rainData:
+                stationData = dict(rainData)
+            elif stationData:
+                stationData = dict(stationData)
             if stationData:
-                conditions[station] = stationData[0]
+                condition_list.append(stationData)
+                conditions[station] = stationData
         self._condition = condition_list
         self._conditions = conditions
 
     def update(self):
-        self.get_forecast()
-        self.get_current_condition()
+        # The forecast and both condition CSVs are independent downloads,
+        # so fetch them concurrently and only parse once all have arrived.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            forecast = executor.submit(self.get_forecast)
+            data = executor.submit(self._get_csv, CURRENT_CONDITION_URL)
+            rain_data = executor.submit(self._get_csv, CURRENT_PRECIPITATION_URL)
+            forecast.result()
+            _LOGGER.debug("Update current condition")
+            self._set_current_condition(data.result(), rain_data.result())
 
     def __get_all_stations(self) -> dict[str, Any]:
         _LOGGER.debug("Getting all stations from : %s" % (STATION_URL))
-        with requests.get(STATION_URL) as response:
-            response.encoding = "iso_8859_1"
-            lines = response.text.split("\n")
-            csv_reader = csv.DictReader(lines, delimiter=";")
-            data = [row for row in csv_reader if row]
+        cache = _read_station_cache()
+        headers = {}
+        if cache is not None:
+            headers = _validator_headers(cache.get("etag"), cache.get("last_modified"))
+        with self._session.get(
+            STATION_URL, headers=headers, stream=True, timeout=_TIMEOUT
+        ) as response:
+            if response.status_code == 304 and cache is not None:
+                _LOGGER.debug("Station list not modified, using cached copy")
+                return cache["data"]
+            response.raise_for_status()
+            _log_response_encoding(response)
+            data = _read_csv(response.iter_lines())
+            etag = response.headers.get("ETag")
+            lastModified = response.headers.get("Last-Modified")
 
         stationList = {}
         for line in data:
@@ -364,53 +533,78 @@ class meteoSwissClient:
             else:
                 _LOGGER.debug("unknown station type %s" % line["Type de station"])
             stationList[stationData["code"]] = stationData
+        if etag or lastModified:
+            _write_station_cache(
+                {
+                    "version": _STATION_CACHE_VERSION,
+                    "etag": etag,
+                    "last_modified": lastModified,
+                    "data": stationList,
+                }
+            )
         return stationList
 
+    def __load_stations(self):
+        self._allStations = self.__get_all_stations()
+        self._stations_by_type = {t: {} for t in StationType}
+        self._station_coords = {None: [], **{t: [] for t in StationType}}
+        for code, station in self._allStations.items():
+            self._stations_by_type[station["type"]][code] = station
+            try:
+                lat = math.radians(float(station["lat"]))
+                lon = math.radians(float(station["lon"]))
+            except ValueError:
+                # Only the closest station lookup needs coordinates.
+                _LOGGER.debug(
+                    "Invalid coordinates for station %s: %s/%s"
+                    % (code, station["lat"], station["lon"])
+                )
+                continue
+            coords = (code, lat, lon, math.cos(lat))
+            self._station_coords[None].append(coords)
+            self._station_coords[station["type"]].append(coords)
+
     def get_all_stations(
         self,
-        station_type=StationType | None,
+        station_type: StationType | None = None,
     ) -> dict[str, Any]:
+        # The returned dictionaries are shared, callers must not modify them.
         if self._allStations is None:
-            self._allStations = self.__get_all_stations()
-        s: dict[str, Any] = {}
-        for station_name, station in self._allStations.items():
-            if station_type is not None and station["type"] != station_type:
-                continue
-            s[station_name] = station
-        return s
+            self.__load_stations()
+        if station_type is None:
+            return self._allStations
+        return self._stations_by_type.get(station_type, {})
 
     def get_closest_station(
-        self, currentLat, currnetLon, station_type=StationType | None
+        self, currentLat, currnetLon, station_type: StationType | None = None
     ):
-        hPoint = geopy.Point(currentLat, currnetLon)
-        data = []
-        for station_name, station in self.get_all_stations(station_type).items():
-            if station_type is not None and station["type"] != station_type:
-                # User has requested a specific station type
-                # and this station is not of that type.
-                continue
-            sPoint = geopy.Point(
-                "%s/%s"
-                % (
-                    station["lat"],
-                    station["lon"],
-                )
+        if self._allStations is None:
+            self.__load_stations()
+        lat = math.radians(float(currentLat))
+        lon = math.radians(float(currnetLon))
+        cosLat = math.cos(lat)
+        # The haversine term grows monotonically with the great-circle
+        # distance, so the closest station is the one minimising it.
+        closest = None
+        closestHav = math.inf
+        for code, sLat, sLon, sCosLat in self._station_coords.get(station_type, []):
+            hav = (
+                math.sin((sLat - lat) / 2) ** 2
+                + cosLat * sCosLat * math.sin((sLon - lon) / 2) ** 2
             )
-            distance = geopy.distance.distance(hPoint, sPoint)
-            data += ((distance.km, station_name),)
-        data.sort(key=lambda tup: tup[0])
-        try:
-            return data[0][1]
-        except BaseException:
+            if hav < closestHav:
+                closest = code
+                closestHav = hav
+        if closest is None:
             _LOGGER.warning(
                 "Unable to get closest station for lat : %s lon : %s"
                 % (currentLat, currnetLon)
             )
-            return None
+        return closest
 
     def get_station_name(self, stationId):
         if self._allStations is None:
-            self._allStations = self.__get_all_stations()
+            self.__load_stations()
 
         try:
             return self._allStations[stationId]["name"]
@@ -419,20 +613,18 @@ class meteoSwissClient:
             return None
 
     def getGeoData(self, lat, lon, user_agent=None):
-        s = requests.Session()
-        s.headers.update(_HEADERS)
-        if user_agent:
-            s.headers.update({"User-Agent": user_agent})
+        headers = {"User-Agent": user_agent} if user_agent else None
 
         uri = (
             "https://nominatim.openstreetmap.org/reverse"
             f"?format=jsonv2&lat={lat}&lon={lon}&zoom=18"
         )
         _LOGGER.debug("Requesting Nominatim OSM data at URL %s", uri)
-        geoData_req = s.get(uri)
+        geoData_req = self._session.get(uri, headers=headers, timeout=_TIMEOUT)
+        _log_response_encoding(geoData_req)
         try:
             geoData_req.raise_for_status()
-            geoData = geoData_req.json()
+            geoData = _loads(geoData_req.content)
             _LOGGER.debug("Got data from OpenStreetMap: %s" % (geoData))
             return geoData
         except Exception:
@@ -450,26 +642,4 @@ class meteoSwissClient:
             return None
 
     def get_wind_bearing(self, val):
-        lis = {
-            "N": [0, 11.25],
-            "NNE": [11.25, 33.75],
-            "NE": [33.75, 56.25],
-            "ENE": [56.25, 78.75],
-            "E": [78.75, 101.25],
-            "ESE": [101.25, 123.75],
-            "SE": [123.75, 146.25],
-            "SSE": [146.25, 168.75],
-            "S": [168.75, 191.25],
-            "SSW": [191.25, 213.75],
-            "SW": [213.75, 236.25],
-            "WSW": [236.25, 258.75],
-            "W": [258.75, 281.25],
-            "WNW": [281.25, 303.75],
-            "NW": [303.75, 326.25],
-            "NNW": [326.25, 348.75],
-        }
-
-        for it in lis:
-            if lis[it][0] <= float(val) <= lis[it][1]:
-                return it
-        return "N"
+        return _BEARINGS[int((float(val) + 11.25) // 22.5) % 16]
@@ -25,9 +25,11 @@ setup(
     packages=find_packages(exclude=("tests",)),
     install_requires=[
         "requests>=2.22.0",
-        "beautifulsoup4>=4.8.2",
-        "geopy>=2.0.0",
+        "urllib3>=1.26.0",
     ],
+    extras_require={
+        "speedups": ["orjson>=3.0.0", "urllib3[brotli,zstd]>=2.0.0"],
+    },
     classifiers=[
         "Development Status :: 2 - Pre-Alpha",
         "License :: OSI Approved :: MIT License",